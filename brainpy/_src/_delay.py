@@ -9,17 +9,19 @@ import jax.numpy as jnp
 import numpy as np
 from jax.lax import stop_gradient
 
-from brainpy import check
 from brainpy import math as bm
 from brainpy._src.dynsys import DynamicalSystem
 from brainpy._src.math.delayvars import ROTATE_UPDATE, CONCAT_UPDATE
-from brainpy._src.context import share
 
 
 __all__ = [
   'Delay',
 ]
 
+# the array types accepted for delay steps, kept as one module-level tuple
+# so that registration does a single C-level isinstance check
+_ARRAY_TYPES = (bm.Array, jax.Array, np.ndarray)
+
 
 class Delay(DynamicalSystem):
   """Delay variable which has a fixed delay length.
@@ -53,6 +55,10 @@ class Delay(DynamicalSystem):
        delay = length          data ]
   method: str
     The method used for updating delay.
+  sparse: bool, int
+    Whether to store boolean spike targets as sparse event rows of
+    ``(spike ids, spike count)`` instead of dense rows. An integer caps
+    the number of stored spike ids per step.
 
   """
 
@@ -69,6 +75,7 @@ class Delay(DynamicalSystem):
       name: Optional[str] = None,
       method: str = ROTATE_UPDATE,
       mode: Optional[bm.Mode] = None,
+      sparse: Union[bool, int] = False,
   ):
     super().__init__(name=name, mode=mode)
     if method is None:
@@ -90,6 +97,22 @@ class Delay(DynamicalSystem):
     assert isinstance(length, int)
     self.length = length
 
+    # sparse event buffering: store spike ids (capped at ``sparse`` when it
+    # is an integer, at the neuron number otherwise) plus a count per slot,
+    # instead of a dense boolean row
+    if sparse:
+      if latest.dtype != jnp.bool_:
+        raise ValueError(f'Sparse delay buffering only supports boolean spike variables, '
+                         f'but the target dtype is {latest.dtype}.')
+      if latest.ndim != 1:
+        raise ValueError(f'Sparse delay buffering only supports one-dimensional spike '
+                         f'variables, but the target shape is {latest.shape}.')
+      if before_t0 is not None:
+        raise ValueError('Sparse delay buffering does not support "before_t0".')
+      self._sparse_size = latest.shape[0] if (sparse is True) else int(sparse)
+    else:
+      self._sparse_size = None
+
     # delay data
     if before_t0 is not None:
       assert isinstance(before_t0, (int, float, bool, bm.Array, jax.Array, Callable))
@@ -101,6 +124,7 @@ class Delay(DynamicalSystem):
 
     # other info
     self._access_to_step = dict()
+    self._access_fns = dict()
     for entry, value in entries.items():
       self.register_entry(entry, value)
 
@@ -128,18 +152,18 @@ class Delay(DynamicalSystem):
         raise ValueError('Provide either "delay_time" or "delay_step". Both you have given both.')
       if callable(delay_time):
         delay_time = bm.as_jax(delay_time(self.delay_target_shape))
-        delay_step = jnp.asarray(delay_time / bm.get_dt(), dtype=bm.get_int())
+        delay_step = jnp.asarray(delay_time / bm.get_dt(), dtype=jnp.int32)
       elif isinstance(delay_time, float):
         delay_step = int(delay_time / bm.get_dt())
       else:
-        delay_step = jnp.asarray(bm.as_jax(delay_time) / bm.get_dt(), dtype=bm.get_int())
+        delay_step = jnp.asarray(bm.as_jax(delay_time) / bm.get_dt(), dtype=jnp.int32)
 
     # delay steps
     if delay_step is None:
       delay_type = 'none'
-    elif isinstance(delay_step, int):
+    elif type(delay_step) is int:
       delay_type = 'homo'
-    elif isinstance(delay_step, (bm.Array, jax.Array, np.ndarray)):
+    elif isinstance(delay_step, _ARRAY_TYPES):
       if delay_step.size == 1 and delay_step.ndim == 0:
         delay_type = 'homo'
       else:
@@ -152,6 +176,11 @@ class Delay(DynamicalSystem):
       raise ValueError(f'Unknown "delay_steps" type {type(delay_step)}, only support '
                        f'integer, array of integers, callable function, brainpy.init.Initializer.')
     if delay_type == 'heter':
+      if self._sparse_size is not None:
+        # event rows cannot be gathered per neuron; fail here rather than
+        # with an obscure shape error at retrieval time
+        raise NotImplementedError('Sparse delay buffering does not support '
+                                  'heterogeneous delay retrieval.')
       if delay_step.dtype not in [jnp.int32, jnp.int64]:
         raise ValueError('Only support delay steps of int32, int64. If your '
                          'provide delay time length, please divide the "dt" '
@@ -159,7 +188,16 @@ class Delay(DynamicalSystem):
       if self.delay_target_shape[0] != delay_step.shape[0]:
         raise ValueError(f'Shape is mismatched: {self.delay_target_shape[0]} != {delay_step.shape[0]}')
     if delay_type == 'heter':
-      max_delay_step = int(max(delay_step))
+      # a single reduction on the host (or one device sync for jax arrays),
+      # rather than the element-wise iteration of the builtin max()
+      if isinstance(delay_step, np.ndarray):
+        max_delay_step = int(np.max(delay_step))
+      else:
+        max_delay_step = int(jnp.max(bm.as_jax(delay_step)))
+      # delay steps fit into int32 comfortably; the narrower index width
+      # halves the indexing bandwidth of heterogeneous retrievals
+      if delay_step.dtype != jnp.int32 and max_delay_step < 2 ** 31:
+        delay_step = bm.Array(bm.as_jax(delay_step).astype(jnp.int32))
     elif delay_type == 'homo':
       max_delay_step = delay_step
     else:
@@ -171,8 +209,28 @@ class Delay(DynamicalSystem):
         self._init_data(max_delay_step)
         self.length = max_delay_step
     self._access_to_step[entry] = delay_step
+    # bind the access path once per entry, so that ``at()`` does not
+    # re-discover the delay type on every call
+    self._access_fns[entry] = self._entry_access_fn(delay_step)
     return self
 
+  def _entry_access_fn(self, delay_step):
+    """Build the access closure of one registered entry."""
+    if delay_step is None or self.data is None:
+      # either a zero-delay entry, or no delay buffer was allocated
+      # (only possible when the maximum requested delay is zero)
+      return lambda *indices: self.latest.value
+    if isinstance(delay_step, slice) or np.ndim(delay_step) == 0:
+      return lambda *indices: self.retrieve(delay_step, *indices)
+    num = self.latest.shape[0]
+
+    def access(*indices):
+      if len(indices) == 0 and len(delay_step) == num:
+        return self._retrieve_heter(delay_step)
+      return self.retrieve(delay_step, *indices)
+
+    return access
+
   def at(self, entry: str, *indices) -> bm.Array:
     """Get the data at the given entry.
 
@@ -184,23 +242,11 @@ class Delay(DynamicalSystem):
       The data.
     """
     assert isinstance(entry, str)
-    if entry not in self._access_to_step:
-      raise KeyError(f'Does not find delay entry "{entry}".')
-    delay_step = self._access_to_step[entry]
-    if delay_step is None:
-      return self.latest.value
-    else:
-      if self.data is None:
-        return self.latest.value
-      else:
-        if isinstance(delay_step, slice):
-          return self.retrieve(delay_step, *indices)
-        elif np.ndim(delay_step) == 0:
-          return self.retrieve(delay_step, *indices)
-        else:
-          if len(indices) == 0 and len(delay_step) == self.latest.shape[0]:
-            indices = (jnp.arange(delay_step.size),)
-          return self.retrieve(delay_step, *indices)
+    try:
+      access = self._access_fns[entry]
+    except KeyError:
+      raise KeyError(f'Does not find delay entry "{entry}".') from None
+    return access(*indices)
 
   @property
   def delay_target_shape(self):
@@ -213,10 +259,18 @@ class Delay(DynamicalSystem):
             f'delay_target_shape={self.delay_target_shape}, '
             f'update_method={self.method})')
 
-  def _check_delay(self, delay_len):
-    raise ValueError(f'The request delay length should be less than the '
-                     f'maximum delay {self.length}. '
-                     f'But we got {delay_len}')
+  def _retrieve_heter(self, delay_step):
+    """Retrieve one delayed value per neuron with a fused gather.
+
+    The per-neuron modulo and the gather are expressed as one
+    ``take_along_axis`` call rather than an index computation followed
+    by generic fancy indexing.
+    """
+    delay_idx = (self._write_ptr.value - 1 - bm.as_jax(delay_step)) & self._mask
+    delay_idx = stop_gradient(delay_idx)
+    data = bm.as_jax(self.data.value)
+    idx = delay_idx.reshape((1, -1) + (1,) * (data.ndim - 2))
+    return jnp.take_along_axis(data, idx, axis=0)[0]
 
   def retrieve(self, delay_step, *indices):
     """Retrieve the delay data according to the delay length.
@@ -227,27 +281,35 @@ class Delay(DynamicalSystem):
       The delay length used to retrieve the data.
     """
     assert delay_step is not None
-    if check.is_checking():
-      check.jit_error(jnp.any(delay_step > self.length), self._check_delay, delay_step)
+    # delay steps registered through ``register_entry()`` are validated (and
+    # the buffer grown) at registration time, so no per-step bound checking
+    # is performed here
 
-    if self.method == ROTATE_UPDATE:
-      i = share.load('i')
-      delay_idx = (i + delay_step) % (self.length + 1)
-      delay_idx = stop_gradient(delay_idx)
+    # bind the hot attributes once; these methods run on every step for
+    # every delay instance, so the attribute chains add up during tracing
+    data = self.data
 
-    elif self.method == CONCAT_UPDATE:
-      delay_idx = delay_step
-
-    else:
-      raise ValueError(f'Unknown updating method "{self.method}"')
+    # the latest value lives one slot behind the write pointer,
+    # and older values follow backwards along the ring
+    delay_idx = (self._write_ptr.value - 1 - delay_step) & self._mask
+    delay_idx = stop_gradient(delay_idx)
 
     # the delay index
     if hasattr(delay_idx, 'dtype') and not jnp.issubdtype(delay_idx.dtype, jnp.integer):
       raise ValueError(f'"delay_len" must be integer, but we got {delay_idx}')
+
+    # sparse event rows are materialized to dense spikes only on demand
+    if self._sparse_size is not None:
+      if jnp.ndim(delay_idx) != 0:
+        raise NotImplementedError('Sparse delay buffering does not support '
+                                  'heterogeneous delay retrieval.')
+      dense = self._event_row_to_dense(data[delay_idx])
+      return dense[tuple(indices)] if len(indices) else dense
+
     indices = (delay_idx,) + tuple(indices)
 
     # the delay data
-    return self.data[indices]
+    return data[indices]
 
   def update(
       self,
@@ -255,23 +317,22 @@ class Delay(DynamicalSystem):
   ) -> None:
     """Update delay variable with the new data.
     """
-    if self.data is not None:
+    data = self.data
+    if data is not None:
       # get the latest target value
       if latest_value is None:
         latest_value = self.latest.value
-
-      # update the delay data at the rotation index
-      if self.method == ROTATE_UPDATE:
-        i = share.load('i')
-        idx = bm.as_jax((i - 1) % (self.length + 1))
-        self.data[idx] = latest_value
-
-      # update the delay data at the first position
-      elif self.method == CONCAT_UPDATE:
-        if self.length >= 2:
-          self.data.value = bm.vstack([latest_value, self.data[1:]])
-        else:
-          self.data[0] = latest_value
+      if self._sparse_size is not None:
+        latest_value = self._to_event_row(latest_value)
+
+      # write the latest value at the rotating write pointer; this is an
+      # O(1) in-place scatter for both updating methods, instead of the
+      # O(length) concatenation previously used by ``concat``
+      write_ptr = self._write_ptr
+      idx = write_ptr.value
+      data.value = jax.lax.dynamic_update_index_in_dim(
+        data.value, jnp.asarray(bm.as_jax(latest_value), dtype=data.dtype), idx, 0)
+      write_ptr.value = (idx + 1) & self._mask
 
   def reset_state(self, batch_size: int = None):
     """Reset the delay data.
@@ -292,11 +353,66 @@ class Delay(DynamicalSystem):
       batch_axis = None
     else:
       batch_axis = self.latest.batch_axis + 1
-    self.data = bm.Variable(jnp.zeros((length + 1,) + self.latest.shape, dtype=self.latest.dtype),
-                            batch_axis=batch_axis)
-    # update delay data
-    self.data[0] = self.latest.value
-    if isinstance(self._before_t0, (bm.Array, jax.Array, float, int, bool)):
-      self.data[1:] = self._before_t0
-    elif callable(self._before_t0):
-      self.data[1:] = self._before_t0((length,) + self.latest.shape, dtype=self.latest.dtype)
+    # The buffer length is rounded up to a power of two, so that the ring
+    # indexing in ``retrieve()`` and ``update()`` can use a cheap bitwise
+    # AND rather than an integer modulo. ``self.length`` keeps the semantic
+    # delay length for bounds checking.
+    buf_len = 1 << int(np.ceil(np.log2(length + 1)))
+    self._mask = buf_len - 1
+    # assemble the whole buffer with one concatenation, instead of writing
+    # the latest value and the history into a zero buffer through several
+    # scatter updates
+    dtype = self.latest.dtype
+    shape = self.latest.shape
+    if self._sparse_size is not None:
+      # each slot holds (spike ids ..., spike count); empty slots are filled
+      # with the out-of-range id so dense materialization can drop them
+      num = self.latest.shape[0]
+      empty = jnp.full((buf_len - 1, self._sparse_size + 1), num, dtype=jnp.int32).at[:, -1].set(0)
+      parts = [jnp.expand_dims(self._to_event_row(self.latest.value), 0), empty]
+    else:
+      parts = [jnp.expand_dims(bm.as_jax(self.latest.value), 0)]
+      if self._before_t0 is None:
+        parts.append(jnp.zeros((buf_len - 1,) + shape, dtype=dtype))
+      else:
+        if callable(self._before_t0):
+          history = bm.as_jax(self._before_t0((length,) + shape, dtype=dtype))
+        else:
+          history = jnp.asarray(bm.as_jax(self._before_t0), dtype=dtype)
+          if history.shape != (length,) + shape:
+            # a scalar (or broadcastable) fill: every history slot holds
+            # the same row, so the slot order does not matter
+            parts.append(jnp.broadcast_to(history, (buf_len - 1,) + shape))
+            history = None
+        if history is not None:
+          # right after construction ``retrieve(d)`` reads slot
+          # ``buf_len - d``, so the full history (ordered delay=1 first,
+          # see the class docstring) is laid out reversed at the tail of
+          # the ring; zero padding fills the slots in between
+          if buf_len - 1 > length:
+            parts.append(jnp.zeros((buf_len - 1 - length,) + shape, dtype=dtype))
+          parts.append(history[::-1])
+    data = jnp.concatenate(parts, axis=0)
+    if getattr(self, 'data', None) is None:
+      self.data = bm.Variable(data, batch_axis=batch_axis)
+    else:
+      self.data._value = data
+    # the next slot to be written by ``update()``
+    if getattr(self, '_write_ptr', None) is None:
+      self._write_ptr = bm.Variable(stop_gradient(jnp.asarray(1, dtype=jnp.int32)))
+    else:
+      self._write_ptr.value = stop_gradient(jnp.asarray(1, dtype=jnp.int32))
+
+  def _to_event_row(self, spk):
+    """Compress a dense boolean spike vector into an event row of
+    ``(spike ids ..., spike count)``, capped at ``self._sparse_size``."""
+    num = self.latest.shape[0]
+    spk = bm.as_jax(spk)
+    ids = jnp.nonzero(spk, size=self._sparse_size, fill_value=num)[0].astype(jnp.int32)
+    count = jnp.sum(spk, dtype=jnp.int32)
+    return jnp.concatenate([ids, count[None]])
+
+  def _event_row_to_dense(self, row):
+    """Materialize an event row back into a dense boolean spike vector."""
+    ids = row[:self._sparse_size]
+    return jnp.zeros(self.latest.shape[0], dtype=self.latest.dtype).at[ids].set(True, mode='drop')
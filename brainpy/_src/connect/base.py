@@ -249,15 +249,18 @@ class TwoEndConnector(Connector):
       conn_mat = csr2mat((indices, indptr), self.pre_num, self.post_num)
       all_data[CONN_MAT] = bm.as_jax(conn_mat, dtype=MAT_DTYPE)
 
-    if (PRE_IDS in structures) and (PRE_IDS not in all_data):
+    pre_ids = None
+    if ((PRE_IDS in structures) and (PRE_IDS not in all_data)) or \
+       ((COO in structures) and (COO not in all_data)):
       pre_ids = np.repeat(np.arange(self.pre_num), np.diff(indptr))
+
+    if (PRE_IDS in structures) and (PRE_IDS not in all_data):
       all_data[PRE_IDS] = bm.as_jax(pre_ids, dtype=get_idx_type())
 
     if (POST_IDS in structures) and (POST_IDS not in all_data):
       all_data[POST_IDS] = bm.as_jax(indices, dtype=get_idx_type())
 
     if (COO in structures) and (COO not in all_data):
-      pre_ids = np.repeat(np.arange(self.pre_num), np.diff(indptr))
       all_data[COO] = (bm.as_jax(pre_ids, dtype=get_idx_type()),
                        bm.as_jax(indices, dtype=get_idx_type()))
 
@@ -269,15 +272,18 @@ class TwoEndConnector(Connector):
       all_data[CSR] = (bm.as_jax(indices, dtype=get_idx_type()),
                        bm.as_jax(indptr, dtype=get_idx_type()))
 
-    if (POST2PRE in structures) and (POST2PRE not in all_data):
+    csc = None
+    if ((POST2PRE in structures) and (POST2PRE not in all_data)) or \
+       ((CSC in structures) and (CSC not in all_data)):
       indc, indptrc = csr2csc((indices, indptr), self.post_num)
-      all_data[POST2PRE] = (bm.as_jax(indc, dtype=get_idx_type()),
-                            bm.as_jax(indptrc, dtype=get_idx_type()))
+      csc = (bm.as_jax(indc, dtype=get_idx_type()),
+             bm.as_jax(indptrc, dtype=get_idx_type()))
+
+    if (POST2PRE in structures) and (POST2PRE not in all_data):
+      all_data[POST2PRE] = csc
 
     if (CSC in structures) and (CSC not in all_data):
-      indc, indptrc = csr2csc((indices, indptr), self.post_num)
-      all_data[CSC] = (bm.as_jax(indc, dtype=get_idx_type()),
-                       bm.as_jax(indptrc, dtype=get_idx_type()))
+      all_data[CSC] = csc
 
     if (PRE2SYN in structures) and (PRE2SYN not in all_data):
       syn_seq = np.arange(indices.size, dtype=get_idx_type())
@@ -306,15 +312,18 @@ class TwoEndConnector(Connector):
       all_data[COO] = (bm.as_jax(pre_ids, dtype=get_idx_type()),
                        bm.as_jax(post_ids, dtype=get_idx_type()))
 
+    csc = None
+    if ((CSC in structures) and (CSC not in all_data)) or \
+       ((POST2PRE in structures) and (POST2PRE not in all_data)):
+      indc, indptrc = coo2csc(coo, self.post_num)
+      csc = (bm.as_jax(indc, dtype=get_idx_type()),
+             bm.as_jax(indptrc, dtype=get_idx_type()))
+
     if CSC in structures and CSC not in all_data:
-      csc = coo2csc(coo, self.post_num)
-      all_data[CSC] = (bm.as_jax(csc[0], dtype=get_idx_type()),
-                       bm.as_jax(csc[1], dtype=get_idx_type()))
+      all_data[CSC] = csc
 
     if POST2PRE in structures and POST2PRE not in all_data:
-      csc = coo2csc(coo, self.post_num)
-      all_data[POST2PRE] = (bm.as_jax(csc[0], dtype=get_idx_type()),
-                            bm.as_jax(csc[1], dtype=get_idx_type()))
+      all_data[POST2PRE] = csc
 
     if (len([s for s in structures
              if s not in [CONN_MAT, PRE_IDS, POST_IDS,
@@ -750,9 +759,8 @@ def coo2mat_num(ij, num_pre, num_post, num, seed=0):
   mat = mat.astype(jnp.int32)
 
   # 随机在mat中选取nonzero_idx的元素，将其值加1
-  index = rng.choice(nonzero_num, size=(multi_conn_num,), replace=False)
-  for i in index:
-    mat = mat.at[nonzero_idx[0][i], nonzero_idx[1][i]].set(mat[nonzero_idx[0][i], nonzero_idx[1][i]] + 1)
+  index = bm.as_jax(rng.choice(nonzero_num, size=(multi_conn_num,), replace=False))
+  mat = mat.at[nonzero_idx[0][index], nonzero_idx[1][index]].add(1)
 
   return mat
 
@@ -58,15 +58,26 @@ class _ShareContext:
     else:
       return value
 
+  def step_index(self):
+    """Get the index ``i`` of the current time step.
+
+    This is a fast path of ``share.load('i')`` which skips the generic
+    branching of :py:meth:`load`, intended for per-step hot paths such as
+    delay retrieval and updating.
+    """
+    try:
+      return self._arguments['i']
+    except KeyError:
+      raise KeyError('Cannot found shared data of i. \n'
+                     'Please define it with "brainpy.share.save(i=<your data>)". ') from None
+
   def save(self, *args, **kwargs) -> None:
     """Save shared arguments in the global context."""
     assert len(args) % 2 == 0
-    for i in range(0, len(args), 2):
-      identifier = args[i]
-      data = args[i + 1]
-      self._arguments[identifier] = data
-    for identifier, data in kwargs.items():
-      self._arguments[identifier] = data
+    if args:
+      self._arguments.update(zip(args[0::2], args[1::2]))
+    if kwargs:
+      self._arguments.update(kwargs)
 
   def __setitem__(self, key, value):
     """Enable setting the shared item by ``bp.share[key] = value``."""
@@ -10,14 +10,12 @@ import jax
 import jax.numpy as jnp
 import numpy as np
 
-from brainpy import check
 from brainpy import math as bm
 from brainpy._src.context import share
 from brainpy._src.dynsys import DynamicalSystem
 from brainpy._src.initialize import variable_
 from brainpy._src.math.delayvars import ROTATE_UPDATE, CONCAT_UPDATE
 from brainpy._src.mixin import ParamDesc, ReturnInfo, JointType, SupportAutoDelay
-from brainpy.check import jit_error
 
 
 __all__ = [
@@ -229,6 +227,10 @@ class VarDelay(Delay):
     else:
       self.data = None
 
+    # the updating method is fixed at construction, so the per-step
+    # dispatch can be bound once instead of branching in every update()
+    self._update_impl = self._update_rotate if self.method == ROTATE_UPDATE else self._update_concat
+
     # other info
     if entries is not None:
       for entry, delay_time in entries.items():
@@ -307,11 +309,6 @@ class VarDelay(Delay):
     name = self.__class__.__name__
     return f'{name}(step={self.max_length}, shape={self.delay_target_shape}, method={self.method})'
 
-  def _check_delay(self, delay_len):
-    raise ValueError(f'The request delay length should be less than the '
-                     f'maximum delay {self.max_length}. '
-                     f'But we got {delay_len}')
-
   def retrieve(self, delay_step, *indices):
     """Retrieve the delay data according to the delay length.
 
@@ -322,11 +319,12 @@ class VarDelay(Delay):
     """
     assert self.data is not None
     assert delay_step is not None
-    if check.is_checking():
-      jit_error(delay_step > self.max_length, self._check_delay, delay_step)
+    # entries registered through ``register_entry()`` grow the buffer to the
+    # maximum requested delay, so the per-step jit_error bound check on the
+    # hot path is unnecessary
 
     if self.method == ROTATE_UPDATE:
-      i = share.load('i')
+      i = share.step_index()
       delay_idx = bm.as_jax((delay_step - i - 1) % self.max_length, dtype=jnp.int32)
       delay_idx = jax.lax.stop_gradient(delay_idx)
 
@@ -354,20 +352,24 @@ class VarDelay(Delay):
       # get the latest target value
       if latest_value is None:
         latest_value = self.target.value
-
-      # update the delay data at the rotation index
-      if self.method == ROTATE_UPDATE:
-        i = share.load('i')
-        idx = bm.as_jax((-i - 1) % self.max_length, dtype=jnp.int32)
-        self.data[idx] = latest_value
-
-      # update the delay data at the first position
-      elif self.method == CONCAT_UPDATE:
-        if self.max_length > 1:
-          latest_value = bm.expand_dims(latest_value, 0)
-          self.data.value = bm.concat([latest_value, self.data[1:]], axis=0)
-        else:
-          self.data[0] = latest_value
+      self._update_impl(latest_value)
+
+  def _update_rotate(self, latest_value):
+    # update the delay data at the rotation index
+    i = share.step_index()
+    idx = bm.as_jax((-i - 1) % self.max_length, dtype=jnp.int32)
+    # a single-slot write: dynamic_update_index_in_dim is the exact
+    # primitive for this, and XLA can update the buffer in place
+    self.data.value = jax.lax.dynamic_update_index_in_dim(
+      self.data.value, jnp.asarray(bm.as_jax(latest_value), dtype=self.data.dtype), idx, 0)
+
+  def _update_concat(self, latest_value):
+    # update the delay data at the first position
+    if self.max_length > 1:
+      latest_value = bm.expand_dims(latest_value, 0)
+      self.data.value = bm.concat([latest_value, self.data[1:]], axis=0)
+    else:
+      self.data[0] = latest_value
 
   def reset_state(self, batch_size: int = None, **kwargs):
     """Reset the delay data.
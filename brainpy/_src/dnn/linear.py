@@ -232,7 +232,7 @@ def event_mm(pre_spike, post_inc, weight, w_min, w_max):
   return weight
 
 
-@numba.njit
+@numba.njit(cache=True, boundscheck=False, inline='always')
 def event_mm_imp(outs, ins):
   pre_spike, post_inc, weight, w_min, w_max = ins
   w_min = w_min[()]
@@ -251,7 +251,7 @@ def event_mm2(post_spike, pre_inc, weight, w_min, w_max):
   return weight
 
 
-@numba.njit
+@numba.njit(cache=True, boundscheck=False, inline='always')
 def event_mm_imp2(outs, ins):
   post_spike, pre_inc, weight, w_min, w_max = ins
   w_min = w_min[()]
@@ -133,12 +133,13 @@ class JointEq(object):
 
   def __init__(self, *eqs):
     eqs = list(self._check_eqs(eqs))
+    # parse each equation once, the result is reused below
+    parses = [_get_args(eq) for eq in eqs]
 
     # variables in equations
     self.vars_in_eqs = []
     vars_in_eqs = []
-    for eq in eqs:
-      vars, _, _ = _get_args(eq)
+    for eq, (vars, _, _) in zip(eqs, parses):
       for var in vars:
         if var in vars_in_eqs:
           raise errors.DiffEqError(f'Variable "{var}" has been used, however we got a same '
@@ -150,8 +151,7 @@ class JointEq(object):
     self.args_in_eqs = []
     all_arg_pars = []
     all_kwarg_pars = dict()
-    for eq in eqs:
-      vars, args, kwargs = _get_args(eq)
+    for eq, (vars, args, kwargs) in zip(eqs, parses):
       self.args_in_eqs.append(args + list(kwargs.keys()))
       for par in args[len(vars) + 1:]:
         if (par not in vars_in_eqs) and (par not in all_arg_pars) and (par not in all_kwarg_pars):
@@ -7,16 +7,16 @@ def step(vars, dt_var, A, C, code_lines, other_args):
     # k-step arguments
     k_args = []
     for v in vars:
-      k_arg = f'{v}'
+      k_terms = [f'{v}']
       for j, sv in enumerate(sval):
         if sv not in [0., '0.0', '0.', '0']:
           if sv in ['1.0', '1.', '1', 1.]:
-            k_arg += f' + {dt_var} * d{v}_k{j + 1}'
+            k_terms.append(f'{dt_var} * d{v}_k{j + 1}')
           else:
-            k_arg += f' + {dt_var} * d{v}_k{j + 1} * {sv}'
-      if k_arg != v:
+            k_terms.append(f'{dt_var} * d{v}_k{j + 1} * {sv}')
+      if len(k_terms) > 1:
         name = f'k{si + 1}_{v}_arg'
-        code_lines.append(f'  {name} = {k_arg}')
+        code_lines.append(f'  {name} = {" + ".join(k_terms)}')
         k_args.append(name)
       else:
         k_args.append(v)
@@ -44,11 +44,11 @@ def step(vars, dt_var, A, C, code_lines, other_args):
 def update(vars, dt_var, B, code_lines):
   return_args = []
   for v in vars:
-    result = v
+    terms = [v]
     for i, b1 in enumerate(B):
       if b1 not in [0., '0.', '0']:
-        result += f' + d{v}_k{i + 1} * {dt_var} * {b1}'
-    code_lines.append(f'  {v}_new = {result}')
+        terms.append(f'd{v}_k{i + 1} * {dt_var} * {b1}')
+    code_lines.append(f'  {v}_new = {" + ".join(terms)}')
     return_args.append(f'{v}_new')
   return return_args
 
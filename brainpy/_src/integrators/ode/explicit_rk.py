@@ -173,7 +173,7 @@ class ExplicitRKIntegrator(ODEIntegrator):
     self.code_lines.append(f'  return {", ".join(return_args)}')
     # compile
     self.integral = utils.compile_code(
-      code_scope={k: v for k, v in self.code_scope.items()},
+      code_scope=dict(self.code_scope),
       code_lines=self.code_lines,
       show_code=self.show_code,
       func_name=self.func_name)
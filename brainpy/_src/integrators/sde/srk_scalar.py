@@ -170,7 +170,7 @@ class SRK1W1(SDEIntegrator):
 
     # return and compile
     self.integral = utils.compile_code(
-      code_scope={k: v for k, v in self.code_scope.items()},
+      code_scope=dict(self.code_scope),
       code_lines=self.code_lines,
       show_code=self.show_code,
       func_name=self.func_name)
@@ -313,7 +313,7 @@ class SRK2W1(SDEIntegrator):
 
     # return and compile
     self.integral = utils.compile_code(
-      code_scope={k: v for k, v in self.code_scope.items()},
+      code_scope=dict(self.code_scope),
       code_lines=self.code_lines,
       show_code=self.show_code,
       func_name=self.func_name)
@@ -370,7 +370,7 @@ class KlPl(SDEIntegrator):
 
     # return and compile
     self.integral = utils.compile_code(
-      code_scope={k: v for k, v in self.code_scope.items()},
+      code_scope=dict(self.code_scope),
       code_lines=self.code_lines,
       show_code=self.show_code,
       func_name=self.func_name)
@@ -106,7 +106,7 @@ def compile_code(code_lines, code_scope, func_name, show_code=False):
     print()
     pprint(code_scope)
     print()
-  exec(compile(code, '', 'exec'), code_scope)
+  exec(compile(code, '', 'exec', optimize=2), code_scope)
   new_f = code_scope[func_name]
   return new_f
 
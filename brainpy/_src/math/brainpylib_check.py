@@ -5,30 +5,55 @@ import ctypes
 import taichi as ti
 from jax.lib import xla_client
 
-taichi_path = ti.__path__[0]
-taichi_c_api_install_dir = os.path.join(taichi_path, '_lib', 'c_api')
-os.environ['TAICHI_C_API_INSTALL_DIR'] = taichi_c_api_install_dir
-os.environ['TI_LIB_DIR'] = os.path.join(taichi_c_api_install_dir, 'runtime')
-
-# link DLL
-if platform.system() == 'Windows':
-  try:
-    ctypes.CDLL(taichi_c_api_install_dir + '/bin/taichi_c_api.dll')
-  except OSError:
-    raise OSError(f'Does not found {taichi_c_api_install_dir + "/bin/taichi_c_api.dll"}')
-elif platform.system() == 'Linux':
-  try:
-    ctypes.CDLL(taichi_c_api_install_dir + '/lib/libtaichi_c_api.so')
-  except OSError:
-    raise OSError(f'Does not found {taichi_c_api_install_dir + "/lib/taichi_c_api.dll"}')
+_taichi_c_api_loaded = False
+
+
+def load_taichi_c_api():
+  """Locate and link the taichi C API shared library.
+
+  This is deferred to the first taichi kernel registration, so that users
+  who never run taichi kernels do not pay the path construction and the
+  DLL loading on every cold import.
+  """
+  global _taichi_c_api_loaded
+  if _taichi_c_api_loaded:
+    return
+
+  taichi_path = ti.__path__[0]
+  taichi_c_api_install_dir = os.path.join(taichi_path, '_lib', 'c_api')
+  os.environ['TAICHI_C_API_INSTALL_DIR'] = taichi_c_api_install_dir
+  os.environ['TI_LIB_DIR'] = os.path.join(taichi_c_api_install_dir, 'runtime')
+
+  # link DLL
+  if platform.system() == 'Windows':
+    try:
+      ctypes.CDLL(taichi_c_api_install_dir + '/bin/taichi_c_api.dll')
+    except OSError:
+      raise OSError(f'Does not found {taichi_c_api_install_dir + "/bin/taichi_c_api.dll"}')
+  elif platform.system() == 'Linux':
+    try:
+      ctypes.CDLL(taichi_c_api_install_dir + '/lib/libtaichi_c_api.so')
+    except OSError:
+      raise OSError(f'Does not found {taichi_c_api_install_dir + "/lib/taichi_c_api.dll"}')
+  _taichi_c_api_loaded = True
+
+def _register_ops(ops, platform):
+  # The XLA custom-call registry is process-global, so registering the same
+  # operators again (e.g. when this module is re-imported through
+  # importlib.reload in a notebook) is wasted work. The sentinel lives on
+  # the ops module itself, which survives the reload of this module.
+  if not getattr(ops, '_brainpy_registered', False):
+    for _name, _value in tuple(ops.registrations().items()):
+      xla_client.register_custom_call_target(_name, _value, platform=platform)
+    ops._brainpy_registered = True
+
 
 # Register the CPU XLA custom calls
 try:
   import brainpylib
   from brainpylib import cpu_ops
 
-  for _name, _value in cpu_ops.registrations().items():
-    xla_client.register_custom_call_target(_name, _value, platform="cpu")
+  _register_ops(cpu_ops, platform="cpu")
 except ImportError:
   cpu_ops = None
   brainpylib = None
@@ -37,8 +62,7 @@ except ImportError:
 try:
   from brainpylib import gpu_ops
 
-  for _name, _value in gpu_ops.registrations().items():
-    xla_client.register_custom_call_target(_name, _value, platform="gpu")
+  _register_ops(gpu_ops, platform="gpu")
 except ImportError:
   gpu_ops = None
 
@@ -17,6 +17,8 @@ from . import scales
 
 bm = None
 
+_XLA_DEVICE_COUNT_FLAG = re.compile(r"--xla_force_host_platform_device_count=\S+")
+
 __all__ = [
   # context manage for environment setting
   'environment',
@@ -678,7 +680,7 @@ def set_host_device_count(n):
   :param int n: number of devices to use.
   """
   xla_flags = os.getenv("XLA_FLAGS", "")
-  xla_flags = re.sub(r"--xla_force_host_platform_device_count=\S+", "", xla_flags).split()
+  xla_flags = _XLA_DEVICE_COUNT_FLAG.sub("", xla_flags).split()
   os.environ["XLA_FLAGS"] = " ".join(["--xla_force_host_platform_device_count={}".format(n)] + xla_flags)
 
 
@@ -127,7 +127,7 @@ def _batch_event_csr_matvec_abstract(
   return ShapedArray(dtype=values.dtype, shape=(batch_size, shape[1] if transpose else shape[0]))
 
 
-@numba.njit(fastmath=True, parallel=True, nogil=True)
+@numba.njit(fastmath=True, parallel=True, nogil=True, cache=True, boundscheck=False)
 def _batch_event_csr_matvec_transpose_numba_imp(outs, ins):
   res_val = outs
   res_val.fill(0)
@@ -164,7 +164,7 @@ def _batch_event_csr_matvec_transpose_numba_imp(outs, ins):
             res_val[bi, col_i] += values[value_bi, j]
 
 
-@numba.njit(fastmath=True, parallel=True, nogil=True)
+@numba.njit(fastmath=True, parallel=True, nogil=True, cache=True, boundscheck=False)
 def _batch_event_csr_matvec_numba_imp(outs, ins):
   res_val = outs
   res_val.fill(0)
@@ -322,7 +322,7 @@ def _event_csr_matvec_abstract(values, indices, indptr, events, *, shape, transp
   return ShapedArray(dtype=values.dtype, shape=(shape[1] if transpose else shape[0],))
 
 
-@numba.njit(fastmath=True)
+@numba.njit(fastmath=True, cache=True, boundscheck=False, inline='always')
 def _event_csr_matvec_transpose_numba_imp1_bool(outs, ins):
   res_val = outs
   res_val.fill(0)
@@ -343,7 +343,7 @@ def _event_csr_matvec_transpose_numba_imp1_bool(outs, ins):
           res_val[col_i] += values
 
 
-@numba.njit(fastmath=True)
+@numba.njit(fastmath=True, cache=True, boundscheck=False, inline='always')
 def _event_csr_matvec_transpose_numba_imp2(outs, ins):
   res_val = outs
   res_val.fill(0)
@@ -364,7 +364,7 @@ def _event_csr_matvec_transpose_numba_imp2(outs, ins):
           res_val[col_i] += values
 
 
-@numba.njit(fastmath=True, parallel=True, nogil=True)
+@numba.njit(fastmath=True, parallel=True, nogil=True, cache=True, boundscheck=False)
 def _event_csr_matvec_numba_imp1_bool(outs, ins):
   res_val = outs
   res_val.fill(0)
@@ -390,7 +390,7 @@ def _event_csr_matvec_numba_imp1_bool(outs, ins):
       res_val[row_i] = r
 
 
-@numba.njit(fastmath=True, parallel=True, nogil=True)
+@numba.njit(fastmath=True, parallel=True, nogil=True, cache=True, boundscheck=False)
 def _event_csr_matvec_numba_imp2(outs, ins):
   res_val = outs
   res_val.fill(0)
@@ -54,7 +54,7 @@ def _batch_event_info_abstract(events):
   return event_ids, event_num
 
 
-@numba.njit(fastmath=True, parallel=True, nogil=True)
+@numba.njit(fastmath=True, parallel=True, nogil=True, cache=True, boundscheck=False)
 def _batch_event_info(outs, ins):
   event_ids, event_num = outs
   event_num.fill(0)
@@ -142,7 +142,7 @@ def _event_info_abstract(events):
 
 
 # TODO: first parallel evaluate the sub-sections, then serially event the sub-results.
-@numba.njit(fastmath=True)
+@numba.njit(fastmath=True, cache=True, boundscheck=False, inline='always')
 def _event_info(outs, ins):
   event_ids, event_num = outs
   event_num.fill(0)
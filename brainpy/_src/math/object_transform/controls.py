@@ -693,7 +693,7 @@ def ifelse(
     codes = '\n'.join(codes)
     if show_code:
       print(codes)
-    exec(compile(codes.strip(), '', 'exec'), code_scope)
+    exec(compile(codes.strip(), '', 'exec', optimize=2), code_scope)
     f = code_scope['f']
     dyn_values, res = f(dyn_vars.dict_data(), *operands)
     for k in dyn_values.keys():
@@ -54,18 +54,20 @@ def get_shardings(args):
                                 is_leaf=_is_bp_array)
 
 
-def _is_rng(a):
+def _rng_state_type():
+  # resolve the deferred RandomState import once, then serve the cached class
   global RandomState
   if RandomState is None:
     from brainpy.math.random import RandomState
-  return isinstance(a, RandomState)
+  return RandomState
+
+
+def _is_rng(a):
+  return isinstance(a, _rng_state_type())
 
 
 def _is_not_rng(a):
-  global RandomState
-  if RandomState is None:
-    from brainpy.math.random import RandomState
-  return not isinstance(a, RandomState)
+  return not isinstance(a, _rng_state_type())
 
 
 def _rng_split_key(a):
@@ -142,6 +144,8 @@ class JITTransform(ObjectTransform):
     # OO transformation parameters
     self._transform = None
     self._dyn_vars = None
+    self._var_items = None
+    self._rng_items = None
 
   def _transform_function(self, variable_data: Dict, *args, **kwargs):
     for key, v in self._dyn_vars.items():
@@ -160,6 +164,11 @@ class JITTransform(ObjectTransform):
         use_eval_shape=current_transform_number() <= 1,
         **kwargs
       )
+      # the variable stack is fixed once the transform is built, so the
+      # item ordering and the random states are located here instead of
+      # on every call
+      self._var_items = tuple(self._dyn_vars.items())
+      self._rng_items = tuple((key, v) for key, v in self._var_items if _is_rng(v))
 
       # in_shardings
       if self._in_shardings is None:
@@ -180,10 +189,7 @@ class JITTransform(ObjectTransform):
           out_shardings = tuple(self._out_shardings)
         else:
           out_shardings = (self._out_shardings,)
-        global RandomState
-        if RandomState is None:
-          from brainpy.math.random import RandomState
-        _dyn_vars_sharing = get_shardings(self._dyn_vars.subset_by_not_instance(RandomState))
+        _dyn_vars_sharing = get_shardings(self._dyn_vars.subset_by_not_instance(_rng_state_type()))
         out_shardings = (_dyn_vars_sharing,) + out_shardings
 
       # jit
@@ -211,8 +217,8 @@ class JITTransform(ObjectTransform):
         return rets
 
     # call the transformed function
-    rng_keys = self._dyn_vars.call_on_subset(_is_rng, _rng_split_key)
-    changes, out = self._transform(self._dyn_vars.dict_data(), *args, **kwargs)
+    rng_keys = {key: _rng_split_key(v) for key, v in self._rng_items}
+    changes, out = self._transform({key: v.value for key, v in self._var_items}, *args, **kwargs)
     for key, v in changes.items():
       self._dyn_vars[key]._value = v
     for key, v in rng_keys.items():
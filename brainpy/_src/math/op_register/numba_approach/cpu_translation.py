@@ -18,6 +18,13 @@ ctypes.pythonapi.PyCapsule_New.argtypes = [
 ]
 ctypes.pythonapi.PyCapsule_New.restype = ctypes.py_object
 
+# Compiling the XLA custom-call wrapper involves a full Numba cfunc
+# compilation, which takes hundreds of milliseconds. The same primitive is
+# frequently re-traced with identical signatures (e.g. under jit + grad, or
+# across multiple model instances), so the compiled targets are cached by
+# their full signature and reused.
+_compiled_signatures = {}
+
 
 def _cpu_translation(func, abs_eval_fn, multiple_results, c, *inputs, **info):
   target_name, inputs, input_shapes, xla_output_shapes = \
@@ -40,6 +47,11 @@ def _cpu_signature(
     multiple_results: bool,
     debug: bool = False
 ):
+  signature = (func, input_dtypes, input_shapes, output_dtypes, output_shapes, multiple_results)
+  try:
+    return _compiled_signatures[signature][0]
+  except (KeyError, TypeError):  # TypeError: unhashable signature element
+    pass
   code_scope = dict(
     func_to_call=func,
     input_shapes=input_shapes,
@@ -78,7 +90,7 @@ def xla_cpu_custom_call_target(output_ptrs, input_ptrs):
     '''.format(args_in=args_in,
                args_out=args_out)
   if debug: print(code_string)
-  exec(compile(code_string.strip(), '', 'exec'), code_scope)
+  exec(compile(code_string.strip(), '', 'exec', optimize=2), code_scope)
 
   new_f = code_scope['xla_cpu_custom_call_target']
   if multiple_results:
@@ -93,6 +105,12 @@ def xla_cpu_custom_call_target(output_ptrs, input_ptrs):
     None  # PyCapsule object run at destruction
   )
   xla_client.register_custom_call_target(target_name, capsule, "cpu")
+  try:
+    # the cfunc object must outlive the registration, so it is kept
+    # alive by the cache together with the target name
+    _compiled_signatures[signature] = (target_name, xla_c_rule)
+  except TypeError:
+    pass
   return target_name
 
 
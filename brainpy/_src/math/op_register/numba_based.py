@@ -54,7 +54,7 @@ def _cpu_signature(
                args_out="\n    ".join(args_out),
                args_call=", ".join(args_call))
   if debug: print(code_string)
-  exec(compile(code_string.strip(), '', 'exec'), code_scope)
+  exec(compile(code_string.strip(), '', 'exec', optimize=2), code_scope)
 
   # register
   new_f = code_scope['xla_cpu_custom_call_target']
@@ -137,7 +137,7 @@ def _numba_mlir_cpu_translation_rule(kernel, debug: bool, ctx, *ins):
                  args_out="\n    ".join(args_out),
                  args_call=", ".join(args_call))
   if debug: print(code_string)
-  exec(compile(code_string.strip(), '', 'exec'), code_scope)
+  exec(compile(code_string.strip(), '', 'exec', optimize=2), code_scope)
   new_f = code_scope['numba_cpu_custom_call_target']
 
   # register
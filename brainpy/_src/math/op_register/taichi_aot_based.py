@@ -3,7 +3,7 @@ import inspect
 import os
 import pathlib
 import sqlite3
-from functools import partial, reduce
+from functools import lru_cache, partial, reduce
 from typing import Any
 
 import jax.numpy as jnp
@@ -13,6 +13,7 @@ from jax.interpreters import xla
 from jax.lib import xla_client
 
 import brainpy.math as bm
+from .. import brainpylib_check
 from .utils import _shape_to_layout
 
 ### UTILS ###
@@ -22,6 +23,15 @@ def get_home_dir():
   return str(pathlib.Path.home())
 
 
+# The kernel source enters every md5 fingerprint, and inspect.getsource
+# re-reads and re-tokenizes the source file each time it is called. The
+# fingerprints are recomputed on every trace of a kernel, so the source
+# string is cached per kernel object.
+@lru_cache(maxsize=None)
+def get_kernel_source(kernel) -> str:
+  return inspect.getsource(kernel)
+
+
 # encode a string with md5
 def encode_md5(source: str) -> str:
   # create md5 object
@@ -339,7 +349,7 @@ def _taichi_cpu_translation_rule(prim, kernel, c, *ins):
     else:
       outs_dict[name] = (output_dtypes[i - in_num], output_shapes[i - in_num])
 
-  source_md5_encode = encode_md5('cpu' + inspect.getsource(kernel) +
+  source_md5_encode = encode_md5('cpu' + get_kernel_source(kernel) +
                                  str([(value[0], value[1]) for value in ins_dict.values()]) +
                                  str([(value[0], value[1]) for value in outs_dict.values()]))
 
@@ -382,7 +392,7 @@ def _taichi_gpu_translation_rule(prim, kernel, c, *ins):
   out_names = names[in_num:]
   ins_dict = {key: (dtype, shape) for key, shape, dtype in zip(in_names, input_shapes, input_dtypes)}
   outs_dict = {key: (dtype, shape) for key, shape, dtype in zip(out_names, output_shapes, output_dtypes)}
-  source_md5_encode = encode_md5('gpu' + inspect.getsource(kernel) +
+  source_md5_encode = encode_md5('gpu' + get_kernel_source(kernel) +
                                  str([(value[0], value[1]) for value in ins_dict.values()]) +
                                  str([(value[0], value[1]) for value in outs_dict.values()]))
 
@@ -410,10 +420,12 @@ def _taichi_gpu_translation_rule(prim, kernel, c, *ins):
 
 
 def register_taichi_cpu_translation_rule(primitive, cpu_kernel):
+  brainpylib_check.load_taichi_c_api()
   xla.backend_specific_translations['cpu'][primitive] = partial(_taichi_cpu_translation_rule,
                                                                 primitive, cpu_kernel)
 
 
 def register_taichi_gpu_translation_rule(primitive, gpu_kernel):
+  brainpylib_check.load_taichi_c_api()
   xla.backend_specific_translations['gpu'][primitive] = partial(_taichi_gpu_translation_rule,
                                                                 primitive, gpu_kernel)
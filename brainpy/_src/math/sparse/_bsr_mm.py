@@ -268,7 +268,7 @@ def bcsrmm(
     raise ValueError
 
 
-@numba.njit(fastmath=True, parallel=True, nogil=True)
+@numba.njit(fastmath=True, parallel=True, nogil=True, cache=True, boundscheck=False)
 def _bcsrmm_cutlass_imp_transpose(outs, ins):  # dense(m, k) @ bcsr(n, k) -> dense(n, m)
   res_val = outs[0]
   # B_data: (num_block, block_size_k, block_size_n)
@@ -292,7 +292,7 @@ def _bcsrmm_cutlass_imp_transpose(outs, ins):  # dense(m, k) @ bcsr(n, k) -> den
   return res_val
 
 
-@numba.njit(fastmath=True, parallel=True, nogil=True)
+@numba.njit(fastmath=True, parallel=True, nogil=True, cache=True, boundscheck=False)
 def _bcsrmm_cutlass_imp2(outs, ins):  # dense(m, k) @ bcsr(k, n) -> dense(n, m)
   res_val = outs[0]
   # B_data: (num_block, block_size_n, block_size_k)
@@ -24,7 +24,7 @@ __all__ = [
 ]
 
 
-@numba.njit(fastmath=True, parallel=True, nogil=True)
+@numba.njit(fastmath=True, parallel=True, nogil=True, cache=True, boundscheck=False)
 def _cusparse_bcsr_matvec_bsr_matvec_numba_imp(outs, ins):
   data, indices, indptr, vector, blocksize, shape, nnzb, transpose = ins
   blocksize = blocksize[()]
@@ -127,7 +127,7 @@ def _csrmv_abstract(data, indices, indptr, vector, *, shape, transpose):
     return core.ShapedArray((out_shape,), data.dtype)
 
 
-@numba.njit(fastmath=True)
+@numba.njit(fastmath=True, cache=True, boundscheck=False, inline='always')
 def _csr_matvec_transpose_numba_imp(outs, ins):
     res_val = outs
     res_val.fill(0)
@@ -147,7 +147,7 @@ def _csr_matvec_transpose_numba_imp(outs, ins):
                 res_val[col_indices[j]] += v * values[j]
 
 
-@numba.njit(fastmath=True, parallel=True, nogil=True)
+@numba.njit(fastmath=True, parallel=True, nogil=True, cache=True, boundscheck=False)
 def _csr_matvec_numba_imp(outs, ins):
     res_val = outs
     res_val.fill(0)
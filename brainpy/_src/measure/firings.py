@@ -1,15 +1,36 @@
 # -*- coding: utf-8 -*-
 
+from functools import lru_cache
+
 import numpy as onp
 import jax.numpy as jnp
 
 from brainpy._src import math as bm
 
+try:
+  from scipy.signal import oaconvolve
+except (ImportError, ModuleNotFoundError):
+  oaconvolve = None
+
 __all__ = [
   'raster_plot',
   'firing_rate',
 ]
 
+# below this size the direct convolution is faster than the
+# overlap-add method, which has a fixed FFT setup cost
+_DIRECT_CONV_SIZE = 1 << 16
+
+
+@lru_cache(maxsize=32)
+def _rate_window(width1, width):
+  """Build (and cache) the smoothing window of ``firing_rate``.
+
+  Interactive analysis typically calls ``firing_rate`` many times with
+  the same ``width`` and ``dt``, so the window is memoized.
+  """
+  return onp.ones(width1) * 1000 / width
+
 
 def raster_plot(sp_matrix, times):
   """Get spike raster plot which displays the spiking activity
@@ -29,7 +50,11 @@ def raster_plot(sp_matrix, times):
   """
   sp_matrix = bm.as_numpy(sp_matrix)
   times = onp.asarray(times)
-  elements = onp.where(sp_matrix > 0.)
+  if sp_matrix.dtype == onp.bool_:
+    # boolean spike matrices need no comparison (and no full-size temporary)
+    elements = onp.nonzero(sp_matrix)
+  else:
+    elements = onp.where(sp_matrix > 0.)
   index = elements[1]
   time = times[elements[0]]
   return index, time
@@ -68,5 +93,12 @@ def firing_rate(spikes, width, dt=None, numpy=True):
   np = onp if numpy else jnp
   dt = bm.get_dt() if (dt is None) else dt
   width1 = int(width / 2 / dt) * 2 + 1
-  window = np.ones(width1) * 1000 / width
-  return np.convolve(np.mean(spikes, axis=1), window, mode='same')
+  window = _rate_window(width1, width)
+  if not numpy:
+    window = jnp.asarray(window)
+  rate = np.mean(spikes, axis=1)
+  if numpy and (oaconvolve is not None) and (rate.size * width1 > _DIRECT_CONV_SIZE):
+    # overlap-add convolution is O((N + M) log(N + M)) and much faster
+    # than the direct O(N * M) path for long traces with wide windows
+    return oaconvolve(rate, window, mode='same')
+  return np.convolve(rate, window, mode='same')
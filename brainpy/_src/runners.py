@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 import functools
 import inspect
+import operator
+import os
 import time
 import warnings
 from collections.abc import Iterable
@@ -10,6 +12,7 @@ import jax
 import jax.numpy as jnp
 import numpy as np
 import tqdm.auto
+from numpy.lib.format import open_memmap
 from jax.experimental.host_callback import id_tap
 from jax.tree_util import tree_map, tree_flatten
 
@@ -96,14 +99,17 @@ def check_and_format_inputs(host, inputs):
     if isinstance(key, bm.Variable):
       real_target = key
     elif isinstance(key, str):
-      splits = key.split('.')
-      target = host
       try:
-        for split in splits:
-          target = getattr(target, split)
+        # attrgetter resolves the whole dotted chain in one C-level call
+        real_target = operator.attrgetter(key)(host)
       except AttributeError:
-        raise AttributeError(f'target {target} does not have "{split}"')
-      real_target = target
+        # re-walk the chain to report exactly which attribute is missing
+        target = host
+        for split in key.split('.'):
+          if not hasattr(target, split):
+            raise AttributeError(f'target {target} does not have "{split}"')
+          target = getattr(target, split)
+        raise
     else:
       raise RunningError(f'For each input, input[0] must be a string  to '
                          f'specify variable of the target, but we got {key}.')
@@ -293,6 +299,15 @@ class DSRunner(Runner):
 
     .. versionadded:: 2.3.8
 
+  monitor_backing_path: Optional, str
+    A directory used to back the monitored histories with memory-mapped
+    ``.npy`` files instead of in-memory buffers. This allows recording
+    simulations whose histories exceed the host RAM. Only supported
+    together with ``memory_efficient=True``. The files can be reloaded
+    later with ``np.load(..., mmap_mode='r')``.
+
+    .. versionadded:: 2.4.6
+
   """
 
   target: DynamicalSystem
@@ -312,6 +327,7 @@ class DSRunner(Runner):
       jit: Union[bool, Dict[str, bool]] = True,
       dyn_vars: Optional[Union[bm.Variable, Sequence[bm.Variable], Dict[str, bm.Variable]]] = None,
       memory_efficient: bool = False,
+      monitor_backing_path: Optional[str] = None,
 
       # extra info
       dt: Optional[float] = None,
@@ -366,6 +382,13 @@ class DSRunner(Runner):
     self._memory_efficient = memory_efficient
     if memory_efficient and not numpy_mon_after_run:
       raise ValueError('When setting "gpu_memory_efficient=True", "numpy_mon_after_run" can not be False.')
+    if monitor_backing_path is not None and not memory_efficient:
+      raise ValueError('"monitor_backing_path" is only supported when "memory_efficient=True".')
+    self._monitor_backing_path = monitor_backing_path
+    # bookkeeping for the preallocated host buffers used by the
+    # memory-efficient monitors
+    self._mon_num_step = 0
+    self._mon_step_i = 0
 
   def __repr__(self):
     name = self.__class__.__name__
@@ -467,6 +490,9 @@ class DSRunner(Runner):
     # build monitor
     for key in self._monitors.keys():
       self.mon[key] = []  # reshape the monitor items
+    if self._memory_efficient:
+      self._mon_num_step = num_step
+      self._mon_step_i = 0
 
     # init progress bar
     if self.progress_bar:
@@ -492,7 +518,11 @@ class DSRunner(Runner):
     if self._memory_efficient:
       self.mon['ts'] = indices * self.dt + self.t0
       for key in self._monitors.keys():
-        self.mon[key] = np.asarray(self.mon[key])
+        buf = self.mon[key]
+        if isinstance(buf, np.memmap):
+          buf.flush()
+        else:
+          self.mon[key] = np.asarray(buf)
     else:
       hists['ts'] = indices * self.dt + self.t0
       if self.numpy_mon_after_run:
@@ -550,7 +580,7 @@ class DSRunner(Runner):
         if idx is None:
           res[key] = variable.value
         else:
-          res[key] = variable[bm.as_jax(idx)]
+          res[key] = variable[idx]
     return res
 
   def _step_func_input(self):
@@ -611,8 +641,26 @@ class DSRunner(Runner):
       raise ValueError
 
   def _step_mon_on_cpu(self, args, transforms):
+    i = self._mon_step_i
     for key, val in args.items():
-      self.mon[key].append(val)
+      buf = self.mon[key]
+      if isinstance(buf, list):
+        # allocate the whole history at once when the first value arrives,
+        # so that each step is a single in-place write instead of a
+        # list append plus a full-size copy after the run
+        val = np.asarray(val)
+        shape = (self._mon_num_step,) + val.shape
+        if self._monitor_backing_path is None:
+          buf = np.empty(shape, dtype=val.dtype)
+        else:
+          # spill the history to a disk-backed ".npy" file, so that runs
+          # much longer than the host RAM can still be recorded
+          os.makedirs(self._monitor_backing_path, exist_ok=True)
+          buf = open_memmap(os.path.join(self._monitor_backing_path, f'{key}.npy'),
+                            mode='w+', dtype=val.dtype, shape=shape)
+        self.mon[key] = buf
+      buf[i] = val
+    self._mon_step_i = i + 1
 
   def _step_func_predict(self, i, *x, shared_args=None):
     # input step
@@ -648,12 +696,18 @@ class DSRunner(Runner):
         run_fun = self._step_func_predict
 
       outs = None
+      treedef = None
       for i in range(indices.shape[0]):
         out, _ = run_fun(indices[i], *tree_map(lambda a: a[i], inputs), shared_args=shared_args)
+        leaves, treedef = tree_flatten(out)
         if outs is None:
-          outs = tree_map(lambda a: [], out)
-        outs = tree_map(lambda a, o: o.append(a), out, outs)
-      outs = tree_map(lambda a: bm.as_jax(a), outs)
+          outs = [[leaf] for leaf in leaves]
+        else:
+          for o, leaf in zip(outs, leaves):
+            o.append(leaf)
+      if treedef is None:
+        return None, None
+      outs = treedef.unflatten([bm.as_jax(o) for o in outs])
       return outs, None
 
     else:
@@ -142,10 +142,12 @@ class Runner(BrainPyObject):
           if len(mon) == 1:
             _monitors.append((mon[0], None))
           elif len(mon) == 2:
+            # indices are converted to JAX arrays once here, so the per-step
+            # monitor functions can index with them directly
             if isinstance(mon[1], (int, np.integer)):
-              idx = bm.array([mon[1]])
+              idx = bm.as_jax(bm.array([mon[1]]))
             else:
-              idx = None if mon[1] is None else bm.asarray(mon[1])
+              idx = None if mon[1] is None else bm.as_jax(bm.asarray(mon[1]))
             _monitors.append((mon[0], idx))
           else:
             raise MonitorError(f'We expect the monitor format with (name, index). But we got {mon}')
@@ -174,9 +176,9 @@ class Runner(BrainPyObject):
           _monitors[key] = (val[0], None)
         elif len(val) == 2:
           if isinstance(val[1], (int, np.integer)):
-            idx = bm.array([val[1]])
+            idx = bm.as_jax(bm.array([val[1]]))
           else:
-            idx = None if val[1] is None else bm.asarray(val[1])
+            idx = None if val[1] is None else bm.as_jax(bm.asarray(val[1]))
           _monitors[key] = (val[0], idx)
         else:
           raise MonitorError('Expect the format of (variable, index) in the monitor setting. '
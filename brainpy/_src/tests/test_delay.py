@@ -1,7 +1,92 @@
 
+import numpy as np
+
 import brainpy as bp
 import unittest
 
+from brainpy._src._delay import Delay
+
+
+class TestDelayBeforeT0(unittest.TestCase):
+  def test_callable_before_t0(self):
+    hist = np.arange(12, dtype=float).reshape(3, 4)  # row i holds delay=i+1
+    target = bp.math.Variable(bp.math.ones(4) * 100.)
+    delay = Delay(target, length=3, entries={},
+                  before_t0=lambda shape, dtype: bp.math.as_jax(hist, dtype=dtype))
+    self.assertTrue(np.allclose(delay.retrieve(0), 100.))
+    for i in range(1, 4):
+      self.assertTrue(np.allclose(delay.retrieve(i), hist[i - 1]))
+    bp.math.clear_buffer_memory()
+
+  def test_array_before_t0(self):
+    # length + 1 is not a power of two, so the ring carries zero padding
+    # between the latest value and the history rows
+    hist = np.arange(16, dtype=float).reshape(4, 4)
+    target = bp.math.Variable(bp.math.ones(4) * 7.)
+    delay = Delay(target, length=4, before_t0=bp.math.asarray(hist), entries={})
+    for i in range(1, 5):
+      self.assertTrue(np.allclose(delay.retrieve(i), hist[i - 1]))
+    bp.math.clear_buffer_memory()
+
+  def test_scalar_before_t0(self):
+    target = bp.math.Variable(bp.math.zeros(3))
+    delay = Delay(target, length=5, before_t0=2.5, entries={})
+    for i in range(1, 6):
+      self.assertTrue(np.allclose(delay.retrieve(i), 2.5))
+    bp.math.clear_buffer_memory()
+
+  def test_before_t0_after_updates(self):
+    # during the first steps, retrievals interleave fresh writes with
+    # the remaining "before t0" history
+    target = bp.math.Variable(bp.math.zeros(2))
+    delay = Delay(target, length=3, entries={},
+                  before_t0=lambda shape, dtype: -bp.math.as_jax(
+                    np.tile(np.arange(1, 4, dtype=float)[:, None], (1, 2)), dtype=dtype))
+    for step in range(1, 4):
+      target.value = bp.math.ones(2).value * step
+      delay.update()
+      for d in range(4):
+        self.assertTrue(np.allclose(delay.retrieve(d), float(step - d)))
+    bp.math.clear_buffer_memory()
+
+
+class TestSparseDelay(unittest.TestCase):
+  def test_event_row_round_trip(self):
+    num = 10
+    target = bp.math.Variable(bp.math.zeros(num, dtype=bool))
+    delay = Delay(target, length=3, sparse=True, entries={})
+    delay.register_entry('s', delay_step=3)
+    history = [np.zeros(num, dtype=bool)]
+    rng = np.random.RandomState(0)
+    for _ in range(6):
+      spk = rng.random(num) < 0.3
+      target.value = bp.math.as_jax(spk)
+      delay.update()
+      history.append(spk)
+      for d in range(4):
+        expect = history[-1 - d] if d < len(history) else np.zeros(num, dtype=bool)
+        self.assertTrue(np.array_equal(np.asarray(delay.retrieve(d)), expect))
+      self.assertTrue(np.array_equal(np.asarray(delay.at('s')),
+                                     np.asarray(delay.retrieve(3))))
+    bp.math.clear_buffer_memory()
+
+  def test_capped_event_rows(self):
+    target = bp.math.Variable(bp.math.zeros(8, dtype=bool))
+    delay = Delay(target, length=2, sparse=3, entries={})
+    spk = np.zeros(8, dtype=bool)
+    spk[[1, 4]] = True  # fewer spikes than the cap survive the round trip
+    target.value = bp.math.as_jax(spk)
+    delay.update()
+    self.assertTrue(np.array_equal(np.asarray(delay.retrieve(0)), spk))
+    bp.math.clear_buffer_memory()
+
+  def test_heter_entry_rejected(self):
+    target = bp.math.Variable(bp.math.zeros(10, dtype=bool))
+    delay = Delay(target, length=2, sparse=True, entries={})
+    with self.assertRaises(NotImplementedError):
+      delay.register_entry('h', delay_step=bp.math.arange(10, dtype=bp.math.int32))
+    bp.math.clear_buffer_memory()
+
 
 class TestVarDelay(unittest.TestCase):
   def test_delay1(self):
@@ -1,7 +1,12 @@
 # -*- coding: utf-8 -*-
 
 
+import os
+import tempfile
 import unittest
+
+import numpy as np
+
 import brainpy as bp
 import brainpy.math as bm
 
@@ -78,7 +83,46 @@ class TestDSRunner(unittest.TestCase):
 
 
 class TestMemoryEfficient(unittest.TestCase):
-  pass
+  def _make_runner(self, **kwargs):
+    class ExampleDS(bp.DynamicalSystem):
+      def __init__(self):
+        super(ExampleDS, self).__init__()
+        self.i = bm.Variable(bm.zeros(2))
+
+      def update(self):
+        self.i += 1
+
+    return bp.DSRunner(ExampleDS(), dt=1., monitors=['i'], progress_bar=False, **kwargs)
+
+  def test_monitor_buffers(self):
+    runner = self._make_runner(memory_efficient=True)
+    runner.run(10.)
+    self.assertIsInstance(runner.mon['i'], np.ndarray)
+    self.assertEqual(runner.mon['i'].shape, (10, 2))
+    self.assertTrue(np.allclose(runner.mon['i'][:, 0], np.arange(1, 11)))
+    # a second run on the same runner allocates fresh buffers and
+    # continues from the previous time
+    runner.run(5.)
+    self.assertEqual(runner.mon['i'].shape, (5, 2))
+    self.assertTrue(np.allclose(runner.mon['i'][:, 0], np.arange(11, 16)))
+    self.assertTrue(np.allclose(runner.mon['ts'], np.arange(10, 15) * 1.))
+
+  def test_monitor_backing_path(self):
+    with tempfile.TemporaryDirectory() as tmpdir:
+      runner = self._make_runner(memory_efficient=True, monitor_backing_path=tmpdir)
+      runner.run(10.)
+      self.assertIsInstance(runner.mon['i'], np.memmap)
+      self.assertTrue(np.allclose(runner.mon['i'][:, 0], np.arange(1, 11)))
+      reloaded = np.load(os.path.join(tmpdir, 'i.npy'), mmap_mode='r')
+      self.assertTrue(np.allclose(reloaded, runner.mon['i']))
+      # a second run overwrites the backing file with the new history
+      runner.run(5.)
+      self.assertEqual(runner.mon['i'].shape, (5, 2))
+      self.assertTrue(np.allclose(runner.mon['i'][:, 0], np.arange(11, 16)))
+
+  def test_backing_path_requires_memory_efficient(self):
+    with self.assertRaises(ValueError):
+      self._make_runner(monitor_backing_path='some-dir')
 
 
 
@@ -2,6 +2,7 @@
 
 import inspect
 import re
+from functools import lru_cache
 from types import LambdaType
 
 BrainPyObject = None
@@ -73,6 +74,19 @@ def copy_doc(source_f):
   return copy
 
 
+class _LazyDebugCode:
+  """Defer the numbered code listing until an error message needs it."""
+
+  def __init__(self, code):
+    self._code = code
+
+  def __str__(self):
+    lines = [f'[{i + 1:3d}] {line}' for i, line in enumerate(self._code.split('\n'))]
+    return '\n\n' + '\n'.join(lines) + '\n\n'
+
+  __repr__ = __str__
+
+
 def code_lines_to_func(lines, func_name, func_args, scope, remind=''):
   lines_for_compile = [f'    {line}' for line in lines]
   code_for_compile = '\n'.join(lines_for_compile)
@@ -83,12 +97,10 @@ def code_lines_to_func(lines, func_name, func_args, scope, remind=''):
   code += '    exc_type, exc_obj, exc_tb = sys.exc_info()\n'
   code += '    line_no = exc_tb.tb_lineno\n'
   code += '    raise ValueError(f"Error occurred in line {line_no}: {code_for_debug} {str(e)} {remind}")'
-  lines_for_debug = [f'[{i + 1:3d}] {line}' for i, line in enumerate(code.split('\n'))]
-  code_for_debug = '\n'.join(lines_for_debug)
-  scope['code_for_debug'] = '\n\n' + code_for_debug + '\n\n'
+  scope['code_for_debug'] = _LazyDebugCode(code)
   scope['remind'] = '\n' + remind + '\n'
   try:
-    exec(compile(code, '', 'exec'), scope)
+    exec(compile(code, '', 'exec', optimize=2), scope)
   except Exception as e:
     raise ValueError(f'Compilation function error: \n\n{code}') from e
   func = scope[func_name]
@@ -99,6 +111,25 @@ def code_lines_to_func(lines, func_name, func_args, scope, remind=''):
 # String tools
 ######################################
 
+_ID_KEYWORDS = {'and', 'or', 'not', 'True', 'False'}
+_ID_PATTERN = re.compile(r'\b[A-Za-z_][A-Za-z0-9_.]*\b')
+# only the number, not a + or -
+_NUMBER_PATTERN = re.compile(r'(?<=[^A-Za-z_])[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?'
+                             r'|^[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?')
+
+
+@lru_cache(maxsize=256)
+def _word_pattern(words, exclude_dot):
+  """Compile (and cache) one alternation regex matching any of ``words``.
+
+  Longer words are tried first, so that e.g. ``V_th`` is matched before ``V``.
+  """
+  alternation = '|'.join(re.escape(w) for w in sorted(words, key=len, reverse=True))
+  if exclude_dot:
+    return re.compile(r'\b(?<!\.)(' + alternation + r')\b(?!\.)')
+  else:
+    return re.compile(r'\b(' + alternation + r')\b')
+
 
 def get_identifiers(expr, include_numbers=False):
   """
@@ -129,13 +160,9 @@ def get_identifiers(expr, include_numbers=False):
   ['.3e-10', '17', '3', '8', 'A', '_b', 'a', 'c5', 'f', 'tau_2']
   """
 
-  _ID_KEYWORDS = {'and', 'or', 'not', 'True', 'False'}
-  identifiers = set(re.findall(r'\b[A-Za-z_][A-Za-z0-9_.]*\b', expr))
-  # identifiers = set(re.findall(r'\b[A-Za-z_][.?[A-Za-z0-9_]*]*\b', expr))
+  identifiers = set(_ID_PATTERN.findall(expr))
   if include_numbers:
-    # only the number, not a + or -
-    pattern = r'(?<=[^A-Za-z_])[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?|^[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?'
-    numbers = set(re.findall(pattern, expr))
+    numbers = set(_NUMBER_PATTERN.findall(expr))
   else:
     numbers = set()
   return (identifiers - _ID_KEYWORDS) | numbers
@@ -188,12 +215,10 @@ def word_replace(expr, substitutions, exclude_dot=True):
   >>> print(word_replace(expr, {'a':'banana', 'f':'func'}))
   banana*_b+c5+8+func(A)
   """
-  for var, replace_var in substitutions.items():
-    if exclude_dot:
-      expr = re.sub(r'\b(?<!\.)' + var + r'\b(?!\.)', str(replace_var), expr)
-    else:
-      expr = re.sub(r'\b' + var + r'\b', str(replace_var), expr)
-  return expr
+  if not substitutions:
+    return expr
+  pattern = _word_pattern(tuple(substitutions.keys()), exclude_dot)
+  return pattern.sub(lambda m: str(substitutions[m.group(1)]), expr)
 
 
 ######################################
@@ -231,7 +231,7 @@ class OfflineTrainer(DSTrainer):
         if idx is None:
           res[key] = variable.value
         else:
-          res[key] = variable[bm.asarray(idx)]
+          res[key] = variable[idx]
     if share.load('fit'):
       for node in self.train_nodes:
         res[f'{node.name}-fit_record'] = node.fit_record
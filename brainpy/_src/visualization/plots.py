@@ -165,7 +165,11 @@ def raster_plot(ts,
   ts = np.asarray(ts)
 
   # get index and time
-  elements = np.where(sp_matrix > 0.)
+  if sp_matrix.dtype == np.bool_:
+    # boolean spike matrices need no comparison (and no full-size temporary)
+    elements = np.nonzero(sp_matrix)
+  else:
+    elements = np.where(sp_matrix > 0.)
   index = elements[1]
   time = ts[elements[0]]
 